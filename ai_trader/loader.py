@@ -67,16 +67,17 @@ class StockLoader(object):
         self.log("Finished all runs.")
 
 
-def load_example(market: Literal["us", "tw"] = "tw") -> pd.DataFrame:
-    datapath = {"tw": "data/tw_stock/2330.csv", "us": "data/us_stock/tsm.csv"}
+EXAMPLE_DATAPATH = {"tw": "data/tw_stock/2330.csv", "us": "data/us_stock/tsm.csv"}
+EXAMPLE_DATE_COL = {"tw": "date", "us": "Date"}
 
-    date_col = "date" if market == "tw" else "Date"
 
-    if market not in datapath.keys():
+def load_example(market: Literal["us", "tw"] = "tw") -> pd.DataFrame:
+    if market not in EXAMPLE_DATAPATH:
         raise ValueError("Market only supports 'tw' or 'us'")
 
+    date_col = EXAMPLE_DATE_COL[market]
     df = pd.read_csv(
-        datapath[market],
+        EXAMPLE_DATAPATH[market],
         parse_dates=[date_col],
         index_col=[date_col],
     )
@@ -1,16 +1,51 @@
+import logging
+from typing import Any, Dict, Tuple
+
 import backtrader as bt
+import pandas as pd
 
+from ai_trader.utils import lowercase_columns
 
-import backtrader as bt
+logger = logging.getLogger(__name__)
 
 
 class BaseStrategy(bt.Strategy):
-    def log(self, txt, dt=None):
+    _STATUS_MAP = {
+        bt.Order.Canceled: "Canceled",
+        bt.Order.Margin: "Margin",
+        bt.Order.Rejected: "Rejected",
+        bt.Order.Partial: "Partial",
+    }
+
+    @classmethod
+    def _signal_inputs(
+        cls, df: pd.DataFrame, params: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], pd.DataFrame]:
+        """
+        The class params updated with `params`, and `df` with lower-cased columns.
+
+        For `to_signals(df, **params)`, which strategies may provide for
+        ai_trader.vector_engine: entry/exit arrays equivalent to next().
+        """
+        return dict(cls.params._getitems(), **params), lowercase_columns(df)
+
+    def log(self, txt, *args, dt=None):
         """
         Log the provided text with a timestamp.
+
+        With `args`, `txt` is a %-format string and the logging module merges them in
+        only when the record is actually emitted; without `args`, `txt` is logged as is.
+
+        Records go to the `ai_trader` logger at INFO level. AITrader.run and
+        sweep.run_backtest(quiet=False) attach a stdout handler for the backtest; when a
+        strategy runs elsewhere (e.g. a plain bt.Cerebro) nothing is printed unless the
+        caller configures INFO logging, e.g. with `ai_trader.utils.queued_logging()`.
         """
         dt = dt or self.datas[0].datetime.date(0)
-        print(f"{dt.isoformat()}, {txt}")
+        if args:
+            logger.info("%s, " + txt, dt, *args)
+        else:
+            logger.info("%s, %s", dt, txt)
 
     def notify_order(self, order):
         """
@@ -20,31 +55,30 @@ class BaseStrategy(bt.Strategy):
             # Buy/Sell order submitted/accepted to/by broker - Nothing to do
             return
 
+        # Skip building log arguments entirely when INFO records are filtered out
+        log_enabled = logger.isEnabledFor(logging.INFO)
+
         # Check if an order has been completed
         if order.status == order.Completed:
-            if order.isbuy():
-                self.log(
-                    f"[BUY]  Price: {order.executed.price:<10.2f} | "
-                    f"Cost: {order.executed.value:<10.2f} | "
-                    f"Comm: {order.executed.comm:<10.2f}"
-                )
-            elif order.issell():
+            if log_enabled:
                 self.log(
-                    f"[SELL] Price: {order.executed.price:<10.2f} | "
-                    f"Cost: {order.executed.value:<10.2f} | "
-                    f"Comm: {order.executed.comm:<10.2f}"
+                    "%s Price: %-10.2f | Cost: %-10.2f | Comm: %-10.2f",
+                    "[BUY] " if order.isbuy() else "[SELL]",
+                    order.executed.price,
+                    order.executed.value,
+                    order.executed.comm,
                 )
             self.bar_executed = len(self)
 
-        elif order.status in [order.Canceled, order.Margin, order.Rejected]:
-            status_map = {
-                order.Canceled: "Canceled",
-                order.Margin: "Margin",
-                order.Rejected: "Rejected",
-                order.Partial: "Partial",
-            }
-            status = status_map.get(order.status, "Unknown")
-            self.log(f"[{order.data._name}] Order placement failed - status: {status}")
+        elif log_enabled and order.status in [
+            order.Canceled,
+            order.Margin,
+            order.Rejected,
+        ]:
+            status = self._STATUS_MAP.get(order.status, "Unknown")
+            self.log(
+                "[%s] Order placement failed - status: %s", order.data._name, status
+            )
 
         # Write down: no pending order
         self.order = None
@@ -53,10 +87,11 @@ class BaseStrategy(bt.Strategy):
         """
         Handle trade notifications.
         """
-        if not trade.isclosed:
+        if not trade.isclosed or not logger.isEnabledFor(logging.INFO):
             return
 
         self.log(
-            f"[OPERATION PROFIT] Gross: {trade.pnl:<10.2f} | "
-            f"Net: {trade.pnlcomm:<10.2f}"
+            "[OPERATION PROFIT] Gross: %-10.2f | Net: %-10.2f",
+            trade.pnl,
+            trade.pnlcomm,
         )
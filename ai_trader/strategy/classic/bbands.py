@@ -1,31 +1,31 @@
-import backtrader as bt
-
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
+from ai_trader.strategy.indicators import FastBollingerBands
 
 
 class BBandsStrategy(BaseStrategy):
     params = dict(period=20, devfactor=2)
 
     def __init__(self):
-        self.bb = bt.indicators.BollingerBands(
+        self.bb = FastBollingerBands(
             self.data, period=self.params.period, devfactor=self.params.devfactor
         )
+        self.signal_buy = self.data.close < self.bb.lines.bot
+        self.signal_sell = self.data.close > self.bb.lines.top
 
     def next(self):
-        signal_buy = self.data.close[0] < self.bb.lines.bot[0]
-        signal_sell = self.data.close[0] > self.bb.lines.top[0]
-
-        if self.position.size == 0:
-            if signal_buy:
+        size = self.position.size
+        if size == 0:
+            if self.signal_buy[0]:
                 self.buy()
 
-        if self.position.size > 0:
-            if signal_sell:
+        if size > 0:
+            if self.signal_sell[0]:
                 self.close()
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(BBandsStrategy)
     trader.run()
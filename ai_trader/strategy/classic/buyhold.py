@@ -1,4 +1,3 @@
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
 
 
@@ -9,6 +8,8 @@ class BuyHoldStrategy(BaseStrategy):
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(BuyHoldStrategy)
     trader.run()
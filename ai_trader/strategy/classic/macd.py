@@ -1,7 +1,7 @@
 import backtrader as bt
 
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
+from ai_trader.strategy.indicators import FastCrossOver
 
 
 class MACDStrategy(BaseStrategy):
@@ -35,9 +35,7 @@ class MACDStrategy(BaseStrategy):
         }
 
         self.macd = bt.talib.MACDEXT(self.data0.close, **kwargs)
-        self.crossover = bt.indicators.CrossOver(
-            self.macd.macd, self.macd.macdsignal, plot=False
-        )
+        self.crossover = FastCrossOver(self.macd.macd, self.macd.macdsignal, plot=False)
         self.above = bt.And(self.macd.macd > 0.0, self.macd.macdsignal > 0.0)
         self.buy_signal = bt.And(self.above, self.crossover == 1)
         self.sell_signal = self.crossover == -1
@@ -57,6 +55,8 @@ class MACDStrategy(BaseStrategy):
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(MACDStrategy)
     trader.run()
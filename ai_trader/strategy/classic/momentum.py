@@ -1,7 +1,11 @@
+from typing import Tuple
+
 import backtrader as bt
+import numpy as np
+import pandas as pd
 
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
+from ai_trader.strategy.indicators import FastSMA
 
 
 class MomentumStrategy(BaseStrategy):
@@ -12,15 +16,22 @@ class MomentumStrategy(BaseStrategy):
     params = dict(sma_period=50, momentum_period=14)
 
     def __init__(self):
-        self.sma = bt.indicators.SimpleMovingAverage(
-            self.data.close, period=self.params.sma_period
-        )
+        self.sma = FastSMA(self.data.close, period=self.params.sma_period)
         self.momentum = bt.indicators.Momentum(
             self.data.close, period=self.params.momentum_period
         )
         self.buy_signal = self.momentum > 0
         self.close_signal = self.data.close < self.sma
 
+    @classmethod
+    def to_signals(cls, df: pd.DataFrame, **params) -> Tuple[np.ndarray, np.ndarray]:
+        p, df = cls._signal_inputs(df, params)
+        close = df["close"]
+        sma = close.rolling(p["sma_period"]).mean()
+        momentum = close - close.shift(p["momentum_period"])
+        ready = sma.notna() & momentum.notna()
+        return (ready & (momentum > 0)).to_numpy(), (ready & (close < sma)).to_numpy()
+
     def next(self):
         if self.position.size == 0:
             if self.buy_signal[0]:
@@ -31,6 +42,8 @@ class MomentumStrategy(BaseStrategy):
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(MomentumStrategy)
     trader.run()
@@ -1,11 +1,14 @@
+import functools
+import operator
+
 import backtrader as bt
 
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
 from ai_trader.strategy.indicators import (
     AverageVolatility,
     RecentHigh,
     DiffHighLow,
+    FastSMA,
 )
 
 
@@ -30,34 +33,35 @@ class RiskAverseStrategy(BaseStrategy):
             self.data, period=self.params.volatility_period
         )
         self.has_new_high = RecentHigh(self.data)
-        self.past_vol = bt.indicators.SimpleMovingAverage(
-            self.data.volume, period=self.params.vol_period
-        )
+        self.past_vol = FastSMA(self.data.volume, period=self.params.vol_period)
         self.diff_high_low = DiffHighLow(self.data, period=self.params.high_low_period)
 
-    def next(self):
         # Conditions
-        cond_1 = (
-            self.candle_volatility.avg_volatility[0] < self.params.volatility_threshold
-        )
-        cond_2 = self.has_new_high.new_high[0] > 0
-        cond_3 = self.past_vol[0] > 100 * 1000
-        cond_4 = self.diff_high_low.diff[0] < self.params.high_low_threshold
+        conditions = [
+            self.candle_volatility.avg_volatility < self.params.volatility_threshold,
+            self.has_new_high.new_high > 0,
+            self.past_vol > 100 * 1000,
+            self.diff_high_low.diff < self.params.high_low_threshold,
+        ]
 
-        # Combined signals
-        conditions = [cond_1, cond_2, cond_3, cond_4]
-        buy_signal = all(conditions)
-        close_signal = sum(not cond for cond in conditions) >= 2
+        # Buy when every condition holds
+        self.buy_signal = bt.All(*conditions)
+        # Close when two or more conditions fail
+        passed = functools.reduce(operator.add, conditions)
+        self.close_signal = passed <= len(conditions) - 2
 
+    def next(self):
         # Execute trades based on signals
         if self.position:
-            if close_signal:
+            if self.close_signal[0]:
                 self.close()
-        elif buy_signal:
+        elif self.buy_signal[0]:
             self.buy()
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(RiskAverseStrategy)
     trader.run()
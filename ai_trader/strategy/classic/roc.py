@@ -1,38 +1,39 @@
+from typing import Tuple
+
 import backtrader as bt
+import numpy as np
+import pandas as pd
 
 from ai_trader.strategy.base import BaseStrategy
-from ai_trader.trader import AITrader
+from ai_trader.strategy.indicators import FastCrossOver, FastROC, FastSMA
 
 
 class ROCStochStrategy(BaseStrategy):
-    parpams = dict(
+    params = dict(
         roc_period=12, stoch_period=14, stoch_smooth=3, oversold=20, overbought=80
     )
 
     def __init__(self):
-        self.roc = bt.indicators.RateOfChange(
-            self.data.close, period=self.params.roc_period
-        )
+        self.roc = FastROC(self.data.close, period=self.params.roc_period)
         self.stoch = bt.indicators.Stochastic(
             self.data,
             period=self.params.stoch_period,
             period_dfast=self.params.stoch_smooth,
         )
-
-    def next(self):
-        signal_buy = (
-            self.roc[0] > 0 and self.stoch.lines.percK[0] < self.params.oversold
+        self.signal_buy = bt.And(
+            self.roc > 0, self.stoch.lines.percK < self.params.oversold
         )
-        signal_sell = (
-            self.roc[0] < 0 and self.stoch.lines.percK[0] > self.params.overbought
+        self.signal_sell = bt.And(
+            self.roc < 0, self.stoch.lines.percK > self.params.overbought
         )
 
+    def next(self):
         if self.position.size == 0:
-            if signal_buy:
+            if self.signal_buy[0]:
                 self.buy()
 
         if self.position.size > 0:
-            if signal_sell:
+            if self.signal_sell[0]:
                 self.close()
 
 
@@ -40,27 +41,20 @@ class ROCMAStrategy(BaseStrategy):
     params = dict(roc_period=12, fast_ma_period=10, slow_ma_period=30)
 
     def __init__(self):
-        self.roc = bt.indicators.RateOfChange(
-            self.data.close, period=self.params.roc_period
-        )
-        self.fast_ma = bt.indicators.SimpleMovingAverage(
-            self.data.close, period=self.params.fast_ma_period
-        )
-        self.slow_ma = bt.indicators.SimpleMovingAverage(
-            self.data.close, period=self.params.slow_ma_period
-        )
-        self.crossover = bt.indicators.CrossOver(self.fast_ma, self.slow_ma)
+        self.roc = FastROC(self.data.close, period=self.params.roc_period)
+        self.fast_ma = FastSMA(self.data.close, period=self.params.fast_ma_period)
+        self.slow_ma = FastSMA(self.data.close, period=self.params.slow_ma_period)
+        self.crossover = FastCrossOver(self.fast_ma, self.slow_ma)
+        self.buy_signal = bt.And(self.roc > 0, self.crossover > 0)
+        self.close_signal = bt.Or(self.roc < 0, self.crossover < 0)
 
     def next(self):
-        buy_signal = self.roc[0] > 0 and self.crossover[0] > 0
-        close_signal = self.roc[0] < 0 or self.crossover[0] < 0
-
         if self.position.size == 0:
-            if buy_signal:
+            if self.buy_signal[0]:
                 self.buy()
 
         if self.position.size > 0:
-            if close_signal:
+            if self.close_signal[0]:
                 self.close()
 
 
@@ -75,10 +69,17 @@ class NaiveROCStrategy(BaseStrategy):
     params = dict(period=20, threshold=0.08)
 
     def __init__(self):
-        self.roc = bt.ind.RateOfChange(self.data, period=self.params.period)
+        self.roc = FastROC(self.data.close, period=self.params.period)
         self.buy_signal = self.roc > self.params.threshold
         self.close_signal = self.roc < -self.params.threshold
 
+    @classmethod
+    def to_signals(cls, df: pd.DataFrame, **params) -> Tuple[np.ndarray, np.ndarray]:
+        p, df = cls._signal_inputs(df, params)
+        close = df["close"]
+        roc = close / close.shift(p["period"]) - 1
+        return (roc > p["threshold"]).to_numpy(), (roc < -p["threshold"]).to_numpy()
+
     def next(self):
         if self.position.size == 0:
             if self.buy_signal[0]:
@@ -90,6 +91,8 @@ class NaiveROCStrategy(BaseStrategy):
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(ROCMAStrategy)
     trader.run()
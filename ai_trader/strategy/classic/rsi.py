@@ -1,8 +1,7 @@
 import backtrader as bt
 
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
-from ai_trader.strategy.indicators import TripleRSI
+from ai_trader.strategy.indicators import FastBollingerBands, FastRSI, TripleRSI
 
 
 class RsiBollingerBandsStrategy(BaseStrategy):
@@ -14,26 +13,25 @@ class RsiBollingerBandsStrategy(BaseStrategy):
     params = dict(rsi_period=14, bb_period=20, bb_dev=2, oversold=30, overbought=70)
 
     def __init__(self):
-        self.rsi = bt.indicators.RSI(period=self.params.rsi_period)
-        self.bbands = bt.indicators.BollingerBands(
+        self.rsi = FastRSI(period=self.params.rsi_period)
+        self.bbands = FastBollingerBands(
             period=self.params.bb_period, devfactor=self.params.bb_dev
         )
-
-    def next(self):
-        buy_signal = (
-            self.rsi < self.params.oversold
-            and self.data.close[0] <= self.bbands.lines.bot[0]
+        self.buy_signal = bt.And(
+            self.rsi < self.params.oversold,
+            self.data.close <= self.bbands.lines.bot,
         )
-        close_signal = (
-            self.rsi > self.params.overbought
-            or self.data.close[0] >= self.bbands.lines.top[0]
+        self.close_signal = bt.Or(
+            self.rsi > self.params.overbought,
+            self.data.close >= self.bbands.lines.top,
         )
 
+    def next(self):
         if self.position.size == 0:
-            if buy_signal:
+            if self.buy_signal[0]:
                 self.buy()
         else:
-            if close_signal:
+            if self.close_signal[0]:
                 self.close()
 
 
@@ -57,26 +55,27 @@ class TripleRsiStrategy(BaseStrategy):
             overbought=self.params.overbought,
         )
         self.sma = bt.indicators.MovingAverageSimple(self.data.close, period=60)
+        self.buy_signal = self.rsi.signal > 0
+        self.close_signal = self.data.close < self.sma
         self.entry_date = None
 
     def next(self):
-        buy_signal = self.rsi > 0
-        close_signal = self.data.close[0] < self.sma[0]
-
         if self.position.size == 0:
-            if buy_signal:
+            if self.buy_signal[0]:
                 self.buy()
-                self.entry_date = self.datetime.date(ago=0)
+                self.entry_date = self.datetime[0]
         else:
-            holding_period = (self.datetime.date(ago=0) - self.entry_date).days
+            holding_period = self.datetime[0] - self.entry_date
 
             # Calculate the holding period in days
-            if close_signal and holding_period > self.params.holding_period:
+            if self.close_signal[0] and holding_period > self.params.holding_period:
                 self.close()
                 self.entry_date = None
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(TripleRsiStrategy)
     trader.run()
@@ -1,4 +1,3 @@
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
 from ai_trader.strategy.indicators import RSRS
 
@@ -12,20 +11,21 @@ class RSRSStrategy(BaseStrategy):
 
     def __init__(self):
         self.rsrs = RSRS(self.data, period=self.params.period)
+        self.buy_signal = self.rsrs.rsrs > self.params.buy_threshold
+        self.close_signal = self.rsrs.rsrs < self.params.close_threshold
 
     def next(self):
-        buy_signal = self.rsrs.rsrs[0] > self.params.buy_threshold
-        close_signal = self.rsrs.rsrs[0] < self.params.close_threshold
-
         if self.position.size == 0:
-            if buy_signal:
+            if self.buy_signal[0]:
                 self.buy()
         else:
-            if close_signal:
+            if self.close_signal[0]:
                 self.close()
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(RSRSStrategy)
     trader.run()
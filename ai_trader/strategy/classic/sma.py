@@ -1,19 +1,28 @@
+from typing import Tuple
+
 import backtrader as bt
+import numpy as np
+import pandas as pd
 
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
+from ai_trader.strategy.indicators import FastCrossOver, FastSMA
 
 
 class NaiveSMAStrategy(BaseStrategy):
     params = dict(period=15)
 
     def __init__(self):
-        self.sma = bt.indicators.MovingAverageSimple(
-            self.data.close, period=self.params.period
-        )
+        self.sma = FastSMA(self.data.close, period=self.params.period)
         self.signal_buy = self.data.close > self.sma
         self.signal_close = self.data.close < self.sma
 
+    @classmethod
+    def to_signals(cls, df: pd.DataFrame, **params) -> Tuple[np.ndarray, np.ndarray]:
+        p, df = cls._signal_inputs(df, params)
+        close = df["close"]
+        sma = close.rolling(p["period"]).mean()
+        return (close > sma).to_numpy(), (close < sma).to_numpy()
+
     def next(self):
         if not self.position:
             if self.signal_buy[0]:
@@ -35,7 +44,19 @@ class CrossSMAStrategy(BaseStrategy):
         self.slow_ma = bt.indicators.SMA(
             self.data.close, period=self.params.slow, plotname="slpw_day_ma"
         )
-        self.crossover = bt.indicators.CrossOver(self.fast_ma, self.slow_ma)
+        self.crossover = FastCrossOver(self.fast_ma, self.slow_ma)
+
+    @classmethod
+    def to_signals(cls, df: pd.DataFrame, **params) -> Tuple[np.ndarray, np.ndarray]:
+        p, df = cls._signal_inputs(df, params)
+        close = df["close"]
+        diff = close.rolling(p["fast"]).mean() - close.rolling(p["slow"]).mean()
+        # Side before each bar, from the last non-zero difference (as in CrossOver)
+        last_diff = diff.replace(0.0, np.nan).ffill().shift()
+        return (
+            ((last_diff < 0) & (diff > 0)).to_numpy(),
+            ((last_diff > 0) & (diff < 0)).to_numpy(),
+        )
 
     def next(self):
         if self.position.size == 0:
@@ -48,6 +69,8 @@ class CrossSMAStrategy(BaseStrategy):
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(CrossSMAStrategy)
     trader.run()
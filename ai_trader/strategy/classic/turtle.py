@@ -1,7 +1,12 @@
 import backtrader as bt
 
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
+from ai_trader.strategy.indicators import (
+    FastCrossOver,
+    FastHighest,
+    FastLowest,
+    FastTrueRange,
+)
 
 
 class TurtleTradingStrategy(BaseStrategy):
@@ -31,38 +36,28 @@ class TurtleTradingStrategy(BaseStrategy):
         self.low = self.datas[0].low
 
         # Calculate the upper Donchian channel: the highest price of the past 20 days
-        self.donchian_high = bt.ind.Highest(
+        self.donchian_high = FastHighest(
             self.high(-1), period=self.p.long_period, subplot=True
         )
 
         # Calculate the lower Donchian channel: the lowest price of the past 10 days
-        self.donchian_low = bt.ind.Lowest(
+        self.donchian_low = FastLowest(
             self.low(-1), period=self.p.short_period, subplot=True
         )
 
         # Generate upper Donchian channel entry breakout: close > DonchianH, value is 1.0; otherwise -1.0
-        self.cross_high = bt.ind.CrossOver(
+        self.cross_high = FastCrossOver(
             self.close(0), self.donchian_high, subplot=False
         )
 
         # Generate lower Donchian channel exit breakdown: close < DonchianL, value is 1.0; otherwise -1.0
-        self.cross_low = bt.ind.CrossOver(
-            self.close(0), self.donchian_low, subplot=False
-        )
+        self.cross_low = FastCrossOver(self.close(0), self.donchian_low, subplot=False)
 
         # True Range (TR): True Range is a measure of volatility that takes into account the price range of an
         # asset over a certain period. It considers the following three values: The current high minus the current
         # low. The absolute value of the current high minus the previous close. The absolute value of the current low
         # minus the previous close.
-        self.TR = bt.ind.Max(
-            (self.high(0) - self.low(0)),  # Current day's high minus current day's low
-            abs(
-                self.high(0) - self.close(-1)
-            ),  # abs(current day's high - previous day's close)
-            abs(
-                self.low(0) - self.close(-1)
-            ),  # abs(current day's low - previous day's close)
-        )
+        self.TR = FastTrueRange(self.datas[0])
 
         # self.ATR = bt.ind.MovingAverageSimple(self.TR, period=self.p.entry_breakout, subplot=False)
 
@@ -75,42 +70,44 @@ class TurtleTradingStrategy(BaseStrategy):
         if self.order:
             return
 
+        close = self.close[0]
+        atr = self.ATR[0]
+
         # If currently holding a long position
         if self.position.size > 0:
             # Add to long position:
             # price rises by 0.5 ATR from the buy price and the number of additions <= 3
-            if (
-                self.datas[0].close > self.last_price + 0.5 * self.ATR[0]
-                and self.buy_count <= 4
-            ):
-                buy_unit = max((self.broker.getvalue() * 0.01) / self.ATR[0], 1)
+            if close > self.last_price + 0.5 * atr and self.buy_count <= 4:
+                buy_unit = max((self.broker.getvalue() * 0.01) / atr, 1)
                 self.order = self.buy(size=int(buy_unit))
                 self.last_price = self.position.price
                 self.buy_count = self.buy_count + 1
 
             # Long position stop loss:
             # stop out when the price falls by 2 ATR
-            elif self.datas[0].close < (self.last_price - 2 * self.ATR[0]):
+            elif close < (self.last_price - 2 * atr):
                 self.order = self.sell(size=abs(self.position.size))
                 self.buy_count = 0
 
             # Long position take profit:
             # take profit and close the position when the price breaks below the 10-day low
-            elif self.cross_low < 0:
+            elif self.cross_low[0] < 0:
                 self.order = self.sell(size=abs(self.position.size))
                 self.buy_count = 0
 
         # If no position is held, wait for the entry opportunity
         else:
             # Entry: go long when the price breaks the upper channel and no position is held
-            if self.cross_high > 0 and self.buy_count == 0:
-                buy_unit = int(max((self.broker.getvalue() * 0.01) / self.ATR[0], 1))
+            if self.cross_high[0] > 0 and self.buy_count == 0:
+                buy_unit = int(max((self.broker.getvalue() * 0.01) / atr, 1))
                 self.order = self.buy(size=buy_unit)
                 self.last_price = self.position.price  # Record the purchase price
                 self.buy_count = 1  # Record the price of this transaction
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(TurtleTradingStrategy)
     trader.run()
@@ -1,8 +1,11 @@
 import backtrader as bt
 
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
-from ai_trader.strategy.indicators import VCPPattern
+from ai_trader.strategy.indicators import (
+    FastSMA,
+    NarrowChannel,
+    VCPPattern,
+)
 
 
 class VCPStrategy(BaseStrategy):
@@ -36,53 +39,43 @@ class VCPStrategy(BaseStrategy):
             highest_close=self.params.highest_close,
             mean_vol=self.params.mean_vol,
         )
-        self.sma_long = bt.indicators.MovingAverageSimple(
-            self.data.close, period=self.params.sma_long
-        )
-        self.sma_short = bt.indicators.MovingAverageSimple(
-            self.data.close, period=self.params.sma_short
-        )
+        self.sma_long = FastSMA(self.data.close, period=self.params.sma_long)
+        self.sma_short = FastSMA(self.data.close, period=self.params.sma_short)
 
-        recent_close_min = bt.indicators.Lowest(
-            self.data.close, period=self.params.recent_price_period
-        )
-        recent_close_max = bt.indicators.Highest(
-            self.data.close, period=self.params.recent_price_period
+        self.narrow_channel = NarrowChannel(
+            self.data.close, period=self.params.recent_price_period, ratio=0.7
         )
-        self.narrow_channel = recent_close_min > recent_close_max * 0.7
-
-    def next(self):
-        # Condition 1: The VCP (Volatility Contraction Pattern) must be positive
-        cond_1 = self.vcp > 0
-
-        # Condition 2: The current volume times the current closing price must be greater than 2,000,000
-        # This ensures that the classic has sufficient liquidity
-        cond_2 = self.data.volume[0] * self.data.close[0] > 2000000
 
-        # Condition 3: The current closing price must be above the 250-day simple moving average (SMA)
-        # This indicates that the classic is in an upward trend over the long term
-        cond_3 = self.data.close[0] > self.sma_long[0]
-
-        # Condition 4: The classic must be in a narrow price channel
-        # This suggests a period of consolidation, which can precede a breakout
-        cond_4 = self.narrow_channel > 0
-
-        # Buy signal: All conditions must be met to generate a buy signal
-        buy_signal = cond_1 & cond_2 & cond_3 & cond_4
+        self.buy_signal = bt.And(
+            # Condition 1: The VCP (Volatility Contraction Pattern) must be positive
+            self.vcp > 0,
+            # Condition 2: The current volume times the current closing price must be greater than 2,000,000
+            # This ensures that the classic has sufficient liquidity
+            self.data.volume * self.data.close > 2000000,
+            # Condition 3: The current closing price must be above the 250-day simple moving average (SMA)
+            # This indicates that the classic is in an upward trend over the long term
+            self.data.close > self.sma_long,
+            # Condition 4: The classic must be in a narrow price channel
+            # This suggests a period of consolidation, which can precede a breakout
+            self.narrow_channel > 0,
+        )
 
         # Close signal: The current closing price falling below the 60-day simple moving average (SMA)
         # This indicates a potential downtrend, triggering a sell signal
-        close_signal = self.data.close[0] < self.sma_short[0]
+        self.close_signal = self.data.close < self.sma_short
 
+    def next(self):
         if self.position.size == 0:
-            if buy_signal:
+            if self.buy_signal[0]:
                 self.buy()
         else:
-            if close_signal:
+            if self.close_signal[0]:
                 self.close()
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(VCPStrategy)
     trader.run()
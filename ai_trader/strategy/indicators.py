@@ -1,6 +1,46 @@
+import math
+
 import backtrader as bt
 import numpy as np
-import statsmodels.api as sm
+from scipy.signal import lfilter
+
+
+def _as_numpy(line) -> np.ndarray:
+    """
+    Zero-copy float64 view over a line's buffer, for use inside a single `once` pass.
+    """
+    return np.frombuffer(line.array, dtype=np.float64)
+
+
+def _mean_std(window, period: int):
+    """
+    Mean and population standard deviation of one window, computed as
+    bt.indicators.StandardDeviation does: sqrt(|mean(x^2) - mean(x)^2|).
+    """
+    mean = math.fsum(window) / period
+    mean_sq = math.fsum(x * x for x in window) / period
+    return mean, abs(mean_sq - mean * mean) ** 0.5
+
+
+def _rolling_mean_std(windows: np.ndarray):
+    """
+    Row-wise `_mean_std` over a `_windows` view.
+    """
+    mean = windows.mean(axis=1)
+    mean_sq = (windows * windows).mean(axis=1)
+    return mean, np.sqrt(np.abs(mean_sq - mean * mean))
+
+
+def _windows(line, start: int, end: int, period: int) -> np.ndarray:
+    """
+    Sliding-window view of the `period` values ending at each bar in [start, end).
+    Empty when there is nothing to compute, e.g. a feed exactly `minperiod` bars long.
+    """
+    if start >= end:
+        return np.empty((0, period))
+    return np.lib.stride_tricks.sliding_window_view(
+        _as_numpy(line)[start - period + 1 : end], period
+    )
 
 
 class RSRS(bt.Indicator):
@@ -53,17 +93,57 @@ class RSRS(bt.Indicator):
         self.period = period
 
     def next(self):
-        high_n = self.high.get(ago=0, size=self.period)
-        low_n = self.low.get(ago=0, size=self.period)
-
-        try:
-            X = sm.add_constant(np.array(low_n))
-            model = sm.OLS(np.array(high_n), X)
-            results = model.fit()
-            self.lines.rsrs[0] = results.params[1]
-            self.lines.R2[0] = results.rsquared
-        except:
+        high_n = np.array(self.high.get(ago=0, size=self.period))
+        low_n = np.array(self.low.get(ago=0, size=self.period))
+
+        # Closed-form OLS of high on low: beta = cov / var(low), R2 = corr^2
+        if len(low_n) < 2:
             self.lines.rsrs[0] = 0
+            return
+        low_dev = low_n - low_n.mean()
+        high_dev = high_n - high_n.mean()
+        var_low = low_dev @ low_dev
+        if var_low == 0:
+            self.lines.rsrs[0] = 0
+            return
+        cov = low_dev @ high_dev
+        self.lines.rsrs[0] = cov / var_low
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.lines.R2[0] = cov * cov / (var_low * (high_dev @ high_dev))
+
+    def once(self, start, end):
+        if self.buflen() < self.period:
+            # get() wraps around a buffer shorter than the window and returns partial
+            # windows; leave those to next() rather than reproduce them here
+            self.once_via_next(start, end)
+            return
+
+        rsrs = _as_numpy(self.lines.rsrs)
+        r2 = _as_numpy(self.lines.R2)
+        # Bars without a full window: get() returns nothing, so next() writes 0 / NaN
+        first = min(max(start, self.period - 1), end)
+        rsrs[start:first] = 0.0
+        r2[start:first] = np.nan
+        if first == end:
+            return
+
+        # Same centred sums as next(), for every window at once
+        lows = np.lib.stride_tricks.sliding_window_view(
+            _as_numpy(self.low)[first - self.period + 1 : end], self.period
+        )
+        highs = np.lib.stride_tricks.sliding_window_view(
+            _as_numpy(self.high)[first - self.period + 1 : end], self.period
+        )
+        low_dev = lows - lows.mean(axis=1, keepdims=True)
+        high_dev = highs - highs.mean(axis=1, keepdims=True)
+        var_low = np.einsum("ij,ij->i", low_dev, low_dev)
+        cov = np.einsum("ij,ij->i", low_dev, high_dev)
+        var_high = np.einsum("ij,ij->i", high_dev, high_dev)
+
+        flat = var_low == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsrs[first:end] = np.where(flat, 0.0, cov / var_low)
+            r2[first:end] = np.where(flat, np.nan, cov * cov / (var_low * var_high))
 
 
 class NormRSRS(bt.Indicator):
@@ -71,9 +151,7 @@ class NormRSRS(bt.Indicator):
 
     def __init__(self, period: int = 18, long_period: int = 600):
         self.rsrs = RSRS(self.data, period=period)
-        self.lines.rsrs_norm = (
-            self.rsrs - bt.ind.Average(self.rsrs, period=long_period)
-        ) / bt.ind.StandardDeviation(self.rsrs, period=long_period)
+        self.lines.rsrs_norm = RollingZScore(self.rsrs, period=long_period)
         self.lines.rsrs_r2 = self.lines.rsrs_norm * self.rsrs.R2
         self.lines.beta_right = self.rsrs * self.lines.rsrs_r2
 
@@ -84,16 +162,20 @@ class RecentHigh(bt.Indicator):
     def __init__(self, short_period: int = 5, long_period: int = 100):
         self.addminperiod(long_period)
         self.short_period = short_period
-        self.long_period = bt.indicators.Highest(self.data.close, period=long_period)
+        self.long_period = FastHighest(self.data.close, period=long_period)
 
     def next(self):
         # Check if the closing price has made a new high in the past 5 days
-        recent_highs = self.data.close.get(size=self.short_period)
-        has_new_high = -1
-        for recent_high in recent_highs:
-            if recent_high >= self.long_period:
-                has_new_high = 1
-        self.lines.new_high[0] = has_new_high
+        recent_high = np.fmax.reduce(self.data.close.get(size=self.short_period))
+        self.lines.new_high[0] = 1 if recent_high >= self.long_period[0] else -1
+
+    def once(self, start, end):
+        recent_highs = np.fmax.reduce(
+            _windows(self.data.close, start, end, self.short_period), axis=1
+        )
+        _as_numpy(self.lines.new_high)[start:end] = np.where(
+            recent_highs >= _as_numpy(self.long_period)[start:end], 1.0, -1.0
+        )
 
 
 class DailyCandleVolatility(bt.Indicator):
@@ -104,25 +186,30 @@ class DailyCandleVolatility(bt.Indicator):
         self.high = self.data.high
         self.low = self.data.low
         self.open = self.data.open
-        self.bullish_candle = self.close >= self.open
 
     def next(self):
-        if self.bullish_candle[0]:
-            bullish_volatility = (
-                abs(self.close[-1] - self.open[0])
-                + abs(self.open[0] - self.low[0])
-                + abs(self.low[0] - self.high[0])
-                + abs(self.high[0] - self.close[0])
-            )
-            self.lines.volatility[0] = bullish_volatility
-        else:
-            bearish_volatility = (
-                abs(self.close[-1] - self.open[0])
-                + abs(self.open[0] - self.high[0])
-                + abs(self.high[0] - self.low[0])
-                + abs(self.low[0] - self.close[0])
-            )
-            self.lines.volatility[0] = bearish_volatility
+        # Gap from the previous close, then open -> low -> high -> close on a bullish
+        # candle or open -> high -> low -> close on a bearish one. With low <= open,
+        # close <= high both paths add up to 2 * (high - low) - |close - open|.
+        self.lines.volatility[0] = (
+            abs(self.close[-1] - self.open[0])
+            + 2.0 * (self.high[0] - self.low[0])
+            - abs(self.close[0] - self.open[0])
+        )
+
+    def once(self, start, end):
+        # Same formula as next(), over column views of the OHLC buffers
+        close_all = _as_numpy(self.close)
+        # take() wraps index -1 on the first bar, as LineBuffer does
+        prev_close = close_all.take(range(start - 1, end - 1))
+        close = close_all[start:end]
+        open_ = _as_numpy(self.open)[start:end]
+        high = _as_numpy(self.high)[start:end]
+        low = _as_numpy(self.low)[start:end]
+
+        _as_numpy(self.lines.volatility)[start:end] = (
+            np.abs(prev_close - open_) + 2.0 * (high - low) - np.abs(close - open_)
+        )
 
 
 class AverageVolatility(bt.Indicator):
@@ -138,10 +225,16 @@ class AverageVolatility(bt.Indicator):
         self.ma_volatility = bt.indicators.MovingAverageSimple(
             self.volatility, period=period
         )
-        self.lines.avg_volatility = self.ma_volatility / self.ma_close * 100
 
     def next(self):
-        pass
+        self.lines.avg_volatility[0] = self.ma_volatility[0] / self.ma_close[0] * 100
+
+    def once(self, start, end):
+        _as_numpy(self.lines.avg_volatility)[start:end] = (
+            _as_numpy(self.ma_volatility)[start:end]
+            / _as_numpy(self.ma_close)[start:end]
+            * 100
+        )
 
 
 class DiffHighLow(bt.Indicator):
@@ -149,14 +242,303 @@ class DiffHighLow(bt.Indicator):
 
     def __init__(self, period: int = 60):
         self.addminperiod(period)
-        self.lowest_low = bt.indicators.Lowest(self.data.low, period=period)
-        self.highest_high = bt.indicators.Highest(self.data.high, period=period)
+        self.lowest_low = FastLowest(self.data.low, period=period)
+        self.highest_high = FastHighest(self.data.high, period=period)
         self.lines.diff = 1 - self.lowest_low / self.highest_high
 
     def next(self):
         pass
 
 
+class FastSMA(bt.Indicator):
+    """
+    Simple moving average with a vectorized `once`, a drop-in for bt.indicators.SMA when
+    running in runonce mode.
+    """
+
+    lines = ("sma",)
+
+    def __init__(self, period: int = 30):
+        self.addminperiod(period)
+        self.period = period
+
+    def next(self):
+        self.lines.sma[0] = math.fsum(self.data.get(size=self.period)) / self.period
+
+    def once(self, start, end):
+        windows = _windows(self.data, start, end, self.period)
+        _as_numpy(self.lines.sma)[start:end] = windows.mean(axis=1)
+
+
+class FastROC(bt.Indicator):
+    """
+    Rate of change, (data - data_period) / data_period, with a vectorized `once`.
+    NaN where the past value is 0.
+    """
+
+    lines = ("roc",)
+
+    def __init__(self, period: int = 12):
+        self.addminperiod(period + 1)
+        self.period = period
+
+    def next(self):
+        past = self.data[-self.period]
+        self.lines.roc[0] = (self.data[0] - past) / past if past else math.nan
+
+    def once(self, start, end):
+        data = _as_numpy(self.data)
+        past = data[start - self.period : end - self.period]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            roc = (data[start:end] - past) / past
+        _as_numpy(self.lines.roc)[start:end] = np.where(past == 0.0, np.nan, roc)
+
+
+class FastHighest(bt.Indicator):
+    """
+    Highest value over a period with a vectorized `once`, a drop-in for
+    bt.indicators.Highest. NaN values are skipped.
+    """
+
+    lines = ("highest",)
+
+    def __init__(self, period: int = 30):
+        self.addminperiod(period)
+        self.period = period
+
+    def next(self):
+        self.lines.highest[0] = np.fmax.reduce(self.data.get(size=self.period))
+
+    def once(self, start, end):
+        windows = _windows(self.data, start, end, self.period)
+        _as_numpy(self.lines.highest)[start:end] = np.fmax.reduce(windows, axis=1)
+
+
+class FastLowest(bt.Indicator):
+    """
+    Lowest value over a period with a vectorized `once`, a drop-in for
+    bt.indicators.Lowest. NaN values are skipped.
+    """
+
+    lines = ("lowest",)
+
+    def __init__(self, period: int = 30):
+        self.addminperiod(period)
+        self.period = period
+
+    def next(self):
+        self.lines.lowest[0] = np.fmin.reduce(self.data.get(size=self.period))
+
+    def once(self, start, end):
+        windows = _windows(self.data, start, end, self.period)
+        _as_numpy(self.lines.lowest)[start:end] = np.fmin.reduce(windows, axis=1)
+
+
+class FastStdDev(bt.Indicator):
+    """
+    Population standard deviation over a period, as bt.indicators.StandardDeviation.
+    """
+
+    lines = ("stddev",)
+
+    def __init__(self, period: int = 20):
+        self.addminperiod(period)
+        self.period = period
+
+    def next(self):
+        _, std = _mean_std(self.data.get(size=self.period), self.period)
+        self.lines.stddev[0] = std
+
+    def once(self, start, end):
+        _, std = _rolling_mean_std(_windows(self.data, start, end, self.period))
+        _as_numpy(self.lines.stddev)[start:end] = std
+
+
+class RollingZScore(bt.Indicator):
+    """
+    (data - mean) / std over a period, with the population standard deviation; NaN on
+    a flat window.
+    """
+
+    lines = ("zscore",)
+
+    def __init__(self, period: int = 600):
+        self.addminperiod(period)
+        self.period = period
+
+    def next(self):
+        mean, std = _mean_std(self.data.get(size=self.period), self.period)
+        # A flat window has no spread to standardize against
+        self.lines.zscore[0] = (self.data[0] - mean) / std if std else math.nan
+
+    def once(self, start, end):
+        mean, std = _rolling_mean_std(_windows(self.data, start, end, self.period))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            zscore = (_as_numpy(self.data)[start:end] - mean) / std
+        _as_numpy(self.lines.zscore)[start:end] = np.where(std == 0.0, np.nan, zscore)
+
+
+class FastCrossOver(bt.Indicator):
+    """
+    Crossover of two lines (1.0 up, -1.0 down, 0.0 otherwise) with a vectorized `once`,
+    a drop-in for bt.indicators.CrossOver. As there, the previous side is taken from the
+    last non-zero difference, so touching a line and then crossing it still counts.
+    """
+
+    lines = ("crossover",)
+    plotinfo = dict(plotymargin=0.05, plotyhlines=[-1.0, 1.0])
+
+    def __init__(self):
+        self.addminperiod(2)
+
+    def nextstart(self):
+        self._last_diff = self.data0[-1] - self.data1[-1]
+        self.next()
+
+    def next(self):
+        diff = self.data0[0] - self.data1[0]
+        if self._last_diff < 0.0 and self.data0[0] > self.data1[0]:
+            self.lines.crossover[0] = 1.0
+        elif self._last_diff > 0.0 and self.data0[0] < self.data1[0]:
+            self.lines.crossover[0] = -1.0
+        else:
+            self.lines.crossover[0] = 0.0
+        if diff:
+            self._last_diff = diff
+
+    def once(self, start, end):
+        # Differences from the first bar both inputs are ready, carrying the last
+        # non-zero value forward over zeros
+        seed = self._minperiod - 2
+        data0 = _as_numpy(self.data0)
+        data1 = _as_numpy(self.data1)
+        diff = data0[seed:end] - data1[seed:end]
+        last = np.where(diff != 0.0, np.arange(len(diff)), 0)
+        last_diff = diff[np.maximum.accumulate(last)][start - 1 - seed : end - 1 - seed]
+
+        data0, data1 = data0[start:end], data1[start:end]
+        up = (last_diff < 0.0) & (data0 > data1)
+        down = (last_diff > 0.0) & (data0 < data1)
+        _as_numpy(self.lines.crossover)[start:end] = up.astype(float) - down
+
+
+class FastTrueRange(bt.Indicator):
+    """
+    True range, max(high - low, |high - prev close|, |low - prev close|), with a
+    vectorized `once`. Same values as bt.indicators.TrueRange.
+    """
+
+    lines = ("tr",)
+
+    def __init__(self):
+        self.addminperiod(2)
+
+    def next(self):
+        high, low, prev_close = self.data.high[0], self.data.low[0], self.data.close[-1]
+        self.lines.tr[0] = max(
+            high - low, abs(high - prev_close), abs(low - prev_close)
+        )
+
+    def once(self, start, end):
+        high = _as_numpy(self.data.high)[start:end]
+        low = _as_numpy(self.data.low)[start:end]
+        prev_close = _as_numpy(self.data.close)[start - 1 : end - 1]
+        _as_numpy(self.lines.tr)[start:end] = np.maximum(
+            high - low,
+            np.maximum(np.fabs(high - prev_close), np.fabs(low - prev_close)),
+        )
+
+
+class FastRSI(bt.Indicator):
+    """
+    Wilder's RSI, a drop-in for bt.indicators.RSI (same SMA seed and smoothing). The
+    `once` runs both smoothed averages through scipy's lfilter instead of a Python loop.
+    """
+
+    lines = ("rsi",)
+    plotinfo = dict(plotyhlines=[30.0, 70.0])
+
+    def __init__(self, period: int = 14):
+        self.addminperiod(period + 1)
+        self.period = period
+        self.alpha = 1.0 / period
+        self.alpha1 = 1.0 - self.alpha
+
+    def nextstart(self):
+        closes = self.data.get(size=self.period + 1)
+        moves = [curr - prev for prev, curr in zip(closes[:-1], closes[1:])]
+        self._avg_up = math.fsum(max(move, 0.0) for move in moves) / self.period
+        self._avg_down = math.fsum(max(-move, 0.0) for move in moves) / self.period
+        self.lines.rsi[0] = self._rsi()
+
+    def next(self):
+        move = self.data[0] - self.data[-1]
+        self._avg_up = self._avg_up * self.alpha1 + max(move, 0.0) * self.alpha
+        self._avg_down = self._avg_down * self.alpha1 + max(-move, 0.0) * self.alpha
+        self.lines.rsi[0] = self._rsi()
+
+    def _rsi(self):
+        # Same values once() gets from IEEE division: no losses -> 100, flat -> NaN
+        if self._avg_down == 0.0:
+            return 100.0 if self._avg_up > 0.0 else math.nan
+        return 100.0 - 100.0 / (1.0 + self._avg_up / self._avg_down)
+
+    def once(self, start, end):
+        # Recomputed from the seed bar on each call; the recurrence needs the history
+        seed = self._minperiod - 1
+        moves = np.diff(_as_numpy(self.data)[:end])
+
+        averages = []
+        for gains in (np.maximum(moves, 0.0), np.maximum(-moves, 0.0)):
+            first = math.fsum(gains[seed - self.period : seed]) / self.period
+            rest, _ = lfilter(
+                [self.alpha],
+                [1.0, -self.alpha1],
+                gains[seed : end - 1],
+                zi=[self.alpha1 * first],
+            )
+            averages.append(np.concatenate(([first], rest)))
+
+        avg_up, avg_down = averages
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100.0 - 100.0 / (1.0 + avg_up / avg_down)
+        _as_numpy(self.lines.rsi)[start:end] = rsi[start - seed :]
+
+
+class FastBollingerBands(bt.Indicator):
+    """
+    Bollinger Bands: the period mean, with bands `devfactor` population standard
+    deviations above and below, as bt.indicators.BollingerBands.
+    """
+
+    lines = ("mid", "top", "bot")
+    plotinfo = dict(subplot=False)
+    plotlines = dict(
+        mid=dict(ls="--"),
+        top=dict(_samecolor=True),
+        bot=dict(_samecolor=True),
+    )
+
+    def __init__(self, period: int = 20, devfactor: float = 2.0):
+        self.addminperiod(period)
+        self.period = period
+        self.devfactor = devfactor
+
+    def next(self):
+        mid, std = _mean_std(self.data.get(size=self.period), self.period)
+        dev = self.devfactor * std
+        self.lines.mid[0] = mid
+        self.lines.top[0] = mid + dev
+        self.lines.bot[0] = mid - dev
+
+    def once(self, start, end):
+        mid, std = _rolling_mean_std(_windows(self.data, start, end, self.period))
+        dev = self.devfactor * std
+        _as_numpy(self.lines.mid)[start:end] = mid
+        _as_numpy(self.lines.top)[start:end] = mid + dev
+        _as_numpy(self.lines.bot)[start:end] = mid - dev
+
+
 class TripleRSI(bt.Indicator):
     lines = (
         "signal",
@@ -164,9 +546,9 @@ class TripleRSI(bt.Indicator):
     )
 
     def __init__(self, rsi_short, rsi_mid, rsi_long, oversold, overbought):
-        self.rsi_short = bt.indicators.RSI(period=rsi_short)
-        self.rsi_mid = bt.indicators.RSI(period=rsi_mid)
-        self.rsi_long = bt.indicators.RSI(period=rsi_long)
+        self.rsi_short = FastRSI(period=rsi_short)
+        self.rsi_mid = FastRSI(period=rsi_mid)
+        self.rsi_long = FastRSI(period=rsi_long)
         self.oversold = oversold
         self.overbought = overbought
 
@@ -182,16 +564,54 @@ class TripleRSI(bt.Indicator):
         value += abs(self.rsi_mid[0] - self.overbought)
 
         # Short-term RSI at a high level and showing signs of consolidation
-        recent_short_rsi = self.rsi_short.get(size=3)
-        cond_3 = min([r > self.oversold for r in recent_short_rsi])
+        short_0, short_1, short_2 = (
+            self.rsi_short[0],
+            self.rsi_short[-1],
+            self.rsi_short[-2],
+        )
+        cond_3 = (
+            short_0 > self.oversold
+            and short_1 > self.oversold
+            and short_2 > self.oversold
+        )
 
         # Short-term RSI in an uptrend
-        cond_4 = (self.rsi_short[0] / self.rsi_short[-2] - 1) > 0.02
-        value += abs(self.rsi_short[0] / self.rsi_short[-2])
+        cond_4 = (short_0 / short_2 - 1) > 0.02
+        value += abs(short_0 / short_2)
 
         self.lines.signal[0] = 1 if cond_1 & cond_2 & cond_3 & cond_4 else -1
         self.lines.value[0] = value
 
+    def once(self, start, end):
+        # Same rules as next(), evaluated over the whole [start, end) range at once
+        rsi_short = _as_numpy(self.rsi_short)
+        rsi_long = _as_numpy(self.rsi_long)[start:end]
+        rsi_mid = _as_numpy(self.rsi_mid)[start:end]
+        short_0 = rsi_short[start:end]
+        short_1 = rsi_short[start - 1 : end - 1]
+        short_2 = rsi_short[start - 2 : end - 2]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            short_ratio = short_0 / short_2
+
+        cond_1 = rsi_long > self.oversold
+        cond_2 = rsi_mid < self.overbought
+        cond_3 = (
+            (short_0 > self.oversold)
+            & (short_1 > self.oversold)
+            & (short_2 > self.oversold)
+        )
+        cond_4 = (short_ratio - 1) > 0.02
+
+        _as_numpy(self.lines.signal)[start:end] = np.where(
+            cond_1 & cond_2 & cond_3 & cond_4, 1.0, -1.0
+        )
+        _as_numpy(self.lines.value)[start:end] = (
+            np.abs(rsi_long - self.oversold)
+            + np.abs(rsi_mid - self.overbought)
+            + np.abs(short_ratio)
+        )
+
 
 class DoubleTop(bt.Indicator):
     lines = ("signal",)
@@ -205,7 +625,7 @@ class DoubleTop(bt.Indicator):
         past_highest: int = 60,
     ):
         self.addminperiod(sma_long)
-        self.past_highest = bt.indicators.Highest(self.data.close, period=past_highest)
+        self.past_highest = FastHighest(self.data.close, period=past_highest)
         self.sma_short = bt.indicators.MovingAverageSimple(
             self.data.close, period=sma_short
         )
@@ -220,31 +640,23 @@ class DoubleTop(bt.Indicator):
         )
 
     def next(self):
+        close = self.data.close
+        past_highest = self.past_highest[0]
+
         # Condition 1: Close price makes a new 60-day high
-        cond_1 = self.data.close[0] == self.past_highest
+        cond_1 = close[0] == past_highest
 
         # Condition 2: At least one day in the previous 30 days did not make a new high
-        cond_2 = any(
-            [p for p in self.data.close.get(ago=1, size=30) if p < self.past_highest]
-        )
+        cond_2 = (np.array(close.get(ago=1, size=30)) < past_highest).any()
 
         # Condition 3: At least one day in the 30th to 55th day before today made a new 60-day high
-        cond_3 = any(
-            [p for p in self.data.close.get(ago=30, size=25) if p > self.past_highest]
-        )
-
-        # Condition 4: Maximum close price in the 30th to 55th day before today is less than today's close
-        try:
-            highest_past = max([p for p in self.data.close.get(ago=25, size=25)])
-            cond_4 = highest_past < self.data.close[0]
-        except ValueError:
-            cond_4 = True
+        cond_3 = (np.array(close.get(ago=30, size=25)) > past_highest).any()
 
         # Condition 5: Close price is greater than the close price 120 days ago
-        cond_5 = self.data.close[0] > self.sma_short[0]  # self..etl.close[-120]
+        cond_5 = close[0] > self.sma_short[0]  # self..etl.close[-120]
 
         # Condition 6: Close price is greater than the close price 60 days ago
-        cond_6 = self.data.close[0] > self.sma_long[0]  # self..etl.close[-60]
+        cond_6 = close[0] > self.sma_long[0]  # self..etl.close[-60]
 
         cond_7 = self.vol_short[0] > self.vol_long[0]
 
@@ -252,6 +664,62 @@ class DoubleTop(bt.Indicator):
             1 if cond_1 & cond_2 & cond_3 & cond_5 & cond_6 & cond_7 else -1
         )
 
+    def once(self, start, end):
+        if start >= end:
+            return
+
+        close_all = _as_numpy(self.data.close)
+        # get() with a positive ago reads bars after the current one and comes back
+        # short at the end of the buffer; NaN padding makes those slots compare False
+        padded = np.concatenate((close_all, np.full(31, np.nan)))
+        close = close_all[start:end]
+        past_highest = _as_numpy(self.past_highest)[start:end]
+
+        cond_1 = close == past_highest
+        # Same windows as close.get(ago=1, size=30) and close.get(ago=30, size=25)
+        window_2 = np.lib.stride_tricks.sliding_window_view(
+            padded[start - 28 : end + 1], 30
+        )
+        cond_2 = (window_2 < past_highest[:, None]).any(axis=1)
+        window_3 = np.lib.stride_tricks.sliding_window_view(
+            padded[start + 6 : end + 30], 25
+        )
+        cond_3 = (window_3 > past_highest[:, None]).any(axis=1)
+        cond_5 = close > _as_numpy(self.sma_short)[start:end]
+        cond_6 = close > _as_numpy(self.sma_long)[start:end]
+        cond_7 = (
+            _as_numpy(self.vol_short)[start:end] > _as_numpy(self.vol_long)[start:end]
+        )
+
+        _as_numpy(self.lines.signal)[start:end] = np.where(
+            cond_1 & cond_2 & cond_3 & cond_5 & cond_6 & cond_7, 1.0, -1.0
+        )
+
+
+class NarrowChannel(bt.Indicator):
+    """
+    1.0 while the lowest value over the period stays above `ratio` times the highest,
+    otherwise 0.0. NaN values are skipped.
+    """
+
+    lines = ("narrow",)
+
+    def __init__(self, period: int = 20, ratio: float = 0.7):
+        self.addminperiod(period)
+        self.period = period
+        self.ratio = ratio
+
+    def next(self):
+        window = self.data.get(size=self.period)
+        lowest, highest = np.fmin.reduce(window), np.fmax.reduce(window)
+        self.lines.narrow[0] = float(lowest > highest * self.ratio)
+
+    def once(self, start, end):
+        windows = _windows(self.data, start, end, self.period)
+        _as_numpy(self.lines.narrow)[start:end] = np.fmin.reduce(windows, axis=1) > (
+            np.fmax.reduce(windows, axis=1) * self.ratio
+        )
+
 
 class VCPPattern(bt.Indicator):
     """
@@ -278,39 +746,31 @@ class VCPPattern(bt.Indicator):
         highest_close: int = 100,
         mean_vol: int = 20,
     ):
-        # Volume reduction condition
-        volume_short_avg = bt.indicators.MovingAverageSimple(
-            self.data.volume, period=period_short
-        )
-        volume_long_avg = bt.indicators.MovingAverageSimple(
-            self.data.volume, period=period_long
-        )
-        self.volume_reduce = volume_short_avg < (volume_long_avg * period_long_discount)
+        self.period_long_discount = period_long_discount
+        # Bit i is set when bar -i was contracting, for the last 5 bars
+        self._contracting_mask = 0
 
-        # Price contraction condition
-        price_short_std = bt.indicators.StandardDeviation(
-            self.data.close, period=period_short
-        )
-        price_long_std = bt.indicators.StandardDeviation(
-            self.data.close, period=period_long
-        )
-        self.price_contract = price_short_std < (price_long_std * period_long_discount)
+        # Volume reduction condition: short volume SMA < long volume SMA * discount
+        self.volume_short_avg = FastSMA(self.data.volume, period=period_short)
+        self.volume_long_avg = FastSMA(self.data.volume, period=period_long)
 
-        self.highest_close = bt.indicators.Highest(
-            self.data.close, period=highest_close
-        )
-        self.mean_vol = bt.indicators.MovingAverageSimple(
-            self.data.volume, period=mean_vol
-        )
+        # Price contraction condition: short price std < long price std * discount
+        self.price_short_std = FastStdDev(self.data.close, period=period_short)
+        self.price_long_std = FastStdDev(self.data.close, period=period_long)
+
+        self.highest_close = FastHighest(self.data.close, period=highest_close)
+        self.mean_vol = FastSMA(self.data.volume, period=mean_vol)
+
+    def prenext(self):
+        # Keep the 5-bar mask rolling so it is complete once next() starts
+        self._push_contracting()
 
     def next(self):
+        self._push_contracting()
+
         # Condition 1: Volume contraction and price contraction over the last 5 days
         # VCP = Volume Contraction Pattern, checks if both volume and price are contracting
-        volume_reduce_5d = [i for i in self.volume_reduce.get(size=5)]
-        price_contract_5d = [i for i in self.price_contract.get(size=5)]
-        cond_1 = any(
-            v > 0.0 and p > 0.0 for v, p in zip(volume_reduce_5d, price_contract_5d)
-        )
+        cond_1 = self._contracting_mask != 0
 
         # Condition 2: The current closing price must be the highest in the past 100 days
         # This indicates the classic is reaching a new high
@@ -322,3 +782,42 @@ class VCPPattern(bt.Indicator):
 
         # Set the VCP line value to 1 if all conditions are met, otherwise set to -1
         self.lines.vcp[0] = 1 if cond_1 & cond_2 & cond_3 else -1
+
+    def _push_contracting(self):
+        contracting = self._contracting(
+            self.volume_short_avg[0],
+            self.volume_long_avg[0],
+            self.price_short_std[0],
+            self.price_long_std[0],
+        )
+        self._contracting_mask = ((self._contracting_mask << 1) | contracting) & 0x1F
+
+    def _contracting(self, volume_short, volume_long, price_short, price_long):
+        # Both contraction tests fused into one boolean array, no operator lines
+        discount = self.period_long_discount
+        return (volume_short < volume_long * discount) & (
+            price_short < price_long * discount
+        )
+
+    def once(self, start, end):
+        if start >= end:
+            return
+
+        # Same three conditions as next(), evaluated for every bar at once
+        contracting = self._contracting(
+            _as_numpy(self.volume_short_avg)[start - 4 : end],
+            _as_numpy(self.volume_long_avg)[start - 4 : end],
+            _as_numpy(self.price_short_std)[start - 4 : end],
+            _as_numpy(self.price_long_std)[start - 4 : end],
+        )
+        cond_1 = np.lib.stride_tricks.sliding_window_view(contracting, 5).any(axis=1)
+
+        close = _as_numpy(self.data.close)[start:end]
+        cond_2 = close == _as_numpy(self.highest_close)[start:end]
+
+        volume = _as_numpy(self.data.volume)[start:end]
+        cond_3 = volume > _as_numpy(self.mean_vol)[start:end] * 0.8
+
+        _as_numpy(self.lines.vcp)[start:end] = np.where(
+            cond_1 & cond_2 & cond_3, 1.0, -1.0
+        )
@@ -1,5 +1,5 @@
-import backtrader as bt
 from ai_trader.strategy.base import BaseStrategy
+from ai_trader.strategy.indicators import FastBollingerBands
 
 
 class MultiBBandsRotationStrategy(BaseStrategy):
@@ -9,7 +9,7 @@ class MultiBBandsRotationStrategy(BaseStrategy):
         self.inds = {}
         for data in self.datas:
             self.inds[data] = {}
-            bbands = bt.indicators.BollingerBands(data, period=self.params.period)
+            bbands = FastBollingerBands(data, period=self.params.period)
             self.inds[data]["buy"] = data.close - bbands.top
             self.inds[data]["sell"] = data.close - bbands.bot
 
@@ -27,7 +27,7 @@ class MultiBBandsRotationStrategy(BaseStrategy):
 
         for sell in to_sell:
             if self.getposition(sell).size > 0:
-                self.log(f"Leave: {sell.p.name}")
+                self.log("Leave: %s", sell.p.name)
                 self.close(sell)
 
         new_hold = list(set(to_buy + holding))
@@ -1,6 +1,5 @@
 import backtrader as bt
 
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
 
 
@@ -25,7 +24,7 @@ class ROCRotationStrategy(BaseStrategy):
         for data in to_close:
             if data in holding:
                 self.order_target_percent(data=data, target=0.0)
-                self.log(f"Leave {data._name}")
+                self.log("Leave %s", data._name)
                 holding.remove(data)
 
         portfolio = list(set(to_buy + holding))
@@ -42,21 +41,23 @@ class ROCRotationStrategy(BaseStrategy):
                 reverse=True,  # Highest ranked first
             )
             portfolio = [item[0] for item in portfolio[: self.top_k]]
-            self.log(f"Selected portfolio: {[p._name for p in portfolio]}")
+            self.log("Selected portfolio: %s", [p._name for p in portfolio])
 
         # 3. Equal weight allocation
         # Existing positions remain unchanged, cash is equally allocated among new additions
         weight = 1 / len(portfolio)
         for p in portfolio:
             if p in holding:
-                self.log(f"Rebalance {p._name}")
+                self.log("Rebalance %s", p._name)
                 self.order_target_percent(p, target=weight * 0.95)
             else:
-                self.log(f"Enter {p._name}")
+                self.log("Enter %s", p._name)
                 self.order_target_percent(p, target=weight * 0.95)
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(ROCRotationStrategy)
     trader.run()
@@ -1,5 +1,4 @@
 from ai_trader.strategy.indicators import RSRS
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
 
 
@@ -58,6 +57,8 @@ class RSRSRotationStrategy(BaseStrategy):
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(RSRSRotationStrategy)
     trader.run()
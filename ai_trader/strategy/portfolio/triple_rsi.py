@@ -1,11 +1,8 @@
 import backtrader as bt
 
-from ai_trader.trader import AITrader
 from ai_trader.strategy.base import BaseStrategy
 from ai_trader.strategy.indicators import TripleRSI
 
-import backtrader as bt
-
 
 class TripleRSIRotationStrategy(BaseStrategy):
     """
@@ -30,17 +27,15 @@ class TripleRSIRotationStrategy(BaseStrategy):
     )
 
     def __init__(self):
-        self.indicators = {
-            data: TripleRSI(
-                data,
-                rsi_short=self.params.rsi_short,
-                rsi_mid=self.params.rsi_mid,
-                rsi_long=self.params.rsi_long,
-                oversold=self.params.oversold,
-                overbought=self.params.overbought,
-            )
-            for data in self.datas
-        }
+        # Same settings for every stock; resolve the params once, not per data feed
+        rsi_kwargs = dict(
+            rsi_short=self.params.rsi_short,
+            rsi_mid=self.params.rsi_mid,
+            rsi_long=self.params.rsi_long,
+            oversold=self.params.oversold,
+            overbought=self.params.overbought,
+        )
+        self.indicators = {data: TripleRSI(data, **rsi_kwargs) for data in self.datas}
         self.order_list = []
         self.last_buy = []
 
@@ -60,7 +55,7 @@ class TripleRSIRotationStrategy(BaseStrategy):
     def rebalance(self):
         # Get current date from index
         current_date = self.data0.datetime.date(0)
-        self.log(f"Rebalance date: {current_date}")
+        self.log("Rebalance date: %s", current_date)
 
         # Exit if it's the last bar to prevent out-of-bounds error
         if len(self.datas[0]) == self.data0.buflen():
@@ -85,7 +80,7 @@ class TripleRSIRotationStrategy(BaseStrategy):
         # 3. Close positions not in the new selection
         to_close = set(self.last_buy) - set(to_buy)
         for data in to_close:
-            self.log(f"Leave: {data._name} | Size: {self.getposition(data).size}")
+            self.log("Leave: %s | Size: %s", data._name, self.getposition(data).size)
             o = self.close(data=data)
             self.order_list.append(o)  # Record order
 
@@ -96,16 +91,17 @@ class TripleRSIRotationStrategy(BaseStrategy):
         # Sort stocks by current holding value (descending) to ensure sell before buy
         to_buy.sort(key=lambda d: self.broker.getvalue([d]), reverse=True)
         self.log(
-            f"Order - target_number: {len(to_buy)} | "
-            f"target_value: {weight * self.broker.getvalue()} | "
-            f"current_ttl_value: {self.broker.getvalue()}"
+            "Order - target_number: %s | target_value: %s | current_ttl_value: %s",
+            len(to_buy),
+            weight * self.broker.getvalue(),
+            self.broker.getvalue(),
         )
 
         for data in to_buy:
             if data in self.last_buy:
-                self.log(f"Rebalance {data._name}")
+                self.log("Rebalance %s", data._name)
             else:
-                self.log(f"Enter {data._name}")
+                self.log("Enter %s", data._name)
 
             o = self.order_target_percent(data, target=weight * 0.95)
             self.order_list.append(o)
@@ -114,6 +110,8 @@ class TripleRSIRotationStrategy(BaseStrategy):
 
 
 if __name__ == "__main__":
+    from ai_trader.trader import AITrader
+
     trader = AITrader()
     trader.add_strategy(TripleRSIRotationStrategy)
     trader.run()
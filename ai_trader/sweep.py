@@ -0,0 +1,124 @@
+import itertools
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Type
+
+import backtrader as bt
+import pandas as pd
+
+from ai_trader.strategy.base import BaseStrategy
+from ai_trader.utils import queued_logging
+
+# Price data shared with each worker process once, via the pool initializer
+_WORKER_DATAS: Dict[str, pd.DataFrame] = {}
+
+
+def run_backtest(
+    strategy: Type[BaseStrategy],
+    df: pd.DataFrame,
+    params: Optional[Dict[str, Any]] = None,
+    cash: int = 1000000,
+    commission: float = 0.001425,
+    quiet: bool = False,
+) -> Dict[str, Any]:
+    """
+    Runs one backtest with the same broker, sizer and analyzers as AITrader and returns
+    the headline metrics only, which keeps results cheap to send between processes.
+
+    With `quiet=True` the `ai_trader` loggers are raised to CRITICAL for the duration
+    of the run, so strategies skip all order/trade log formatting. Otherwise the run is
+    wrapped in `queued_logging()`, as in AITrader.run, so the order/trade log is printed
+    to stdout unless the caller has configured logging already.
+    """
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(
+        bt.feeds.PandasData(dataname=df, openinterest=None, timeframe=bt.TimeFrame.Days)
+    )
+    cerebro.addstrategy(strategy, **(params or {}))
+    cerebro.broker.setcash(cash)
+    cerebro.broker.setcommission(commission=commission)
+    cerebro.addsizer(bt.sizers.PercentSizer, percents=95)
+    cerebro.addanalyzer(bt.analyzers.SharpeRatio, _name="SharpeRatio")
+    cerebro.addanalyzer(bt.analyzers.DrawDown, _name="DrawDown")
+    cerebro.addanalyzer(bt.analyzers.Returns, _name="Returns")
+
+    logger = logging.getLogger("ai_trader")
+    previous_level = logger.level
+    if quiet:
+        logger.setLevel(logging.CRITICAL)
+    try:
+        with nullcontext() if quiet else queued_logging():
+            result = cerebro.run()[0]
+    finally:
+        logger.setLevel(previous_level)
+
+    returns = result.analyzers.Returns.get_analysis()
+    drawdown = result.analyzers.DrawDown.get_analysis()
+    return {
+        "final_value": cerebro.broker.getvalue(),
+        "total_returns": returns["rtot"],
+        "normalized_returns": returns["rnorm"],
+        "sharpe_ratio": result.analyzers.SharpeRatio.get_analysis().get("sharperatio"),
+        "max_drawdown": drawdown.get("max", {}).get("drawdown"),
+    }
+
+
+def _init_worker(datas: Dict[str, pd.DataFrame]) -> None:
+    global _WORKER_DATAS
+    _WORKER_DATAS = datas
+
+
+def _run_task(
+    strategy: Type[BaseStrategy],
+    ticker: str,
+    params: Dict[str, Any],
+    cash: int,
+    commission: float,
+    quiet: bool,
+) -> Dict[str, Any]:
+    metrics = run_backtest(
+        strategy, _WORKER_DATAS[ticker], params, cash, commission, quiet
+    )
+    return {"ticker": ticker, "params": params, **metrics}
+
+
+def expand_grid(grid: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """
+    Expands {"param": [values, ...]} into one params dict per combination, for run_batch.
+    """
+    return [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+
+
+def run_batch(
+    strategy: Type[BaseStrategy],
+    param_sets: List[Dict[str, Any]],
+    datas: Dict[str, pd.DataFrame],
+    cash: int = 1000000,
+    commission: float = 0.001425,
+    max_workers: Optional[int] = None,
+    quiet: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Backtests every (ticker, params) combination across a process pool.
+
+    `datas` maps a ticker to its price DataFrame; each worker receives the frames once
+    at start-up, so tasks only carry the ticker and the parameter dict. Results come
+    back in task order, tickers outermost. Workers run quietly by default; see
+    `run_backtest`.
+    """
+    tasks = [(ticker, params) for ticker in datas for params in param_sets]
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=_init_worker,
+        initargs=(datas,),
+    ) as executor:
+        futures = [
+            executor.submit(
+                _run_task, strategy, ticker, params, cash, commission, quiet
+            )
+            for ticker, params in tasks
+        ]
+        return [future.result() for future in futures]
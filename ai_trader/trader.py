@@ -7,7 +7,7 @@ import pandas as pd
 
 from ai_trader.loader import load_example
 from ai_trader.strategy.base import BaseStrategy
-from ai_trader.utils import extract_ticker_from_path
+from ai_trader.utils import extract_ticker_from_path, queued_logging
 
 
 class AITrader:
@@ -133,7 +133,8 @@ class AITrader:
             self.add_broker()
             self.add_sizer()
             self.add_analyzers()
-            result = self.cerebro.run()
+            with queued_logging():
+                result = self.cerebro.run()
             self.analyze(result)
         else:
             raise ValueError("No strategy specified.")
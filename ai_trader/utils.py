@@ -1,11 +1,26 @@
+import logging
+import queue
 import re
-from typing import List
+import sys
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import Iterator, List
+
+import pandas as pd
 
 
 def check_rules(conds: List[bool], cutoff: int) -> bool:
     return sum(1 for cond in conds if not cond) >= cutoff
 
 
+def lowercase_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns the frame with lower-cased column names, so "Close"/"Volume" frames (e.g.
+    load_example("us")) are read the same way bt.feeds.PandasData reads them.
+    """
+    return df.rename(columns=str.lower)
+
+
 def extract_ticker_from_path(file_path: str) -> str:
     """
     Extracts the ticker symbol from the given file path.
@@ -15,3 +30,48 @@ def extract_ticker_from_path(file_path: str) -> str:
         return match.group(1)
     else:
         raise ValueError("Ticker symbol not found in the file path")
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    A QueueHandler that enqueues records untouched, so %-formatting of the message
+    happens on the listener thread instead of the backtest loop.
+
+    Only suitable for an in-process queue: records are not made picklable, and log
+    arguments must not be mutated after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+@contextmanager
+def queued_logging(level: int = logging.INFO) -> Iterator[None]:
+    """
+    Routes the `ai_trader` loggers through a queue for the duration of the block.
+
+    Strategies only enqueue raw records on the backtest loop; a background thread
+    formats and writes them to stdout. The queue is drained before the block exits. If logging has
+    already been configured by the caller, it is left untouched.
+    """
+    logger = logging.getLogger("ai_trader")
+    if logger.hasHandlers():
+        yield
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    queue_handler = DeferredQueueHandler(log_queue)
+
+    previous_level = logger.level
+    logger.addHandler(queue_handler)
+    logger.setLevel(level)
+    listener.start()
+    try:
+        yield
+    finally:
+        listener.stop()
+        logger.removeHandler(queue_handler)
+        logger.setLevel(previous_level)
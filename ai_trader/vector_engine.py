@@ -0,0 +1,112 @@
+from typing import Any, Dict, List, Type
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+from ai_trader.strategy.base import BaseStrategy
+from ai_trader.utils import lowercase_columns
+
+
+def positions_from_signals(entries: np.ndarray, exits: np.ndarray) -> np.ndarray:
+    """
+    Long-only position (0/1) held after each bar, following the same rule as the
+    classic strategies' next(): buy on an entry while flat, close on an exit while long.
+    """
+    positions = np.zeros(len(entries), dtype=np.int8)
+    is_long = False
+    for i, (entry, exit_) in enumerate(zip(entries.tolist(), exits.tolist())):
+        is_long = not exit_ if is_long else entry
+        positions[i] = is_long
+    return positions
+
+
+def run_vector(
+    entries: np.ndarray,
+    exits: np.ndarray,
+    close: np.ndarray,
+    commission: float = 0.001425,
+    cash: int = 1000000,
+) -> Dict[str, Any]:
+    """
+    Evaluates boolean entry/exit arrays against close prices without the backtrader
+    event loop.
+
+    A signal on bar i is held from bar i + 1 (close-to-close returns), fully invested,
+    with `commission` charged on every position change. This is an approximation of
+    AITrader (which fills at the next open with a 95% sizer), meant for screening large
+    parameter sweeps before confirming the candidates with a full backtest.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    positions = positions_from_signals(
+        np.asarray(entries, dtype=bool), np.asarray(exits, dtype=bool)
+    )
+
+    held = np.concatenate(([0.0], positions[:-1]))
+    bar_returns = np.concatenate(([0.0], np.diff(close) / close[:-1]))
+    turnover = np.abs(np.diff(held, prepend=0.0))
+    equity = cash * np.cumprod(1 + bar_returns * held - turnover * commission)
+    drawdown = 1 - equity / np.maximum.accumulate(equity)
+
+    return {
+        "final_value": equity[-1],
+        "total_returns": np.log(equity[-1] / cash),
+        "max_drawdown": drawdown.max() * 100,
+        "trades": int(np.count_nonzero(np.diff(held) > 0)),
+        "equity": equity,
+    }
+
+
+def screen(
+    strategy: Type[BaseStrategy],
+    df: pd.DataFrame,
+    param_sets: List[Dict[str, Any]],
+    commission: float = 0.001425,
+    cash: int = 1000000,
+) -> List[Dict[str, Any]]:
+    """
+    Runs run_vector for every params dict on a strategy that provides `to_signals`,
+    e.g. with sweep.expand_grid. Results keep the input order and drop the equity curves.
+    """
+    close = lowercase_columns(df)["close"].to_numpy(dtype=np.float64)
+    results = []
+    for params in param_sets:
+        entries, exits = strategy.to_signals(df, **params)
+        metrics = run_vector(entries, exits, close, commission, cash)
+        del metrics["equity"]
+        results.append({"params": params, **metrics})
+    return results
+
+
+def check_signals(
+    strategy: Type[BaseStrategy], df: pd.DataFrame, **params: Any
+) -> Dict[str, int]:
+    """
+    Runs the strategy through backtrader and counts the bars on which its
+    `buy_signal`/`close_signal` lines disagree with `strategy.to_signals(df, **params)`,
+    from the first bar next() sees. Both counts are 0 when the port is faithful.
+
+    Only for strategies that build those two lines in __init__.
+    """
+    captured = {}
+
+    class _Capture(strategy):
+        def stop(self):
+            super().stop()
+            captured["first"] = self._minperiod - 1
+            captured["buy"] = np.frombuffer(self.buy_signal.array) > 0
+            captured["close"] = np.frombuffer(self.close_signal.array) > 0
+
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(
+        bt.feeds.PandasData(dataname=df, openinterest=None, timeframe=bt.TimeFrame.Days)
+    )
+    cerebro.addstrategy(_Capture, **params)
+    cerebro.run()
+
+    entries, exits = strategy.to_signals(df, **params)
+    first = captured["first"]
+    return {
+        "entries": int(np.count_nonzero(entries[first:] != captured["buy"][first:])),
+        "exits": int(np.count_nonzero(exits[first:] != captured["close"][first:])),
+    }
@@ -0,0 +1,54 @@
+import backtrader as bt
+import numpy as np
+import pytest
+
+from ai_trader.loader import load_example
+from ai_trader.strategy import indicators
+
+# (fast, reference, kwargs, minperiod); both are built on data.close unless noted
+PAIRS = [
+    (indicators.FastSMA, bt.indicators.SMA, dict(period=15), 15),
+    (indicators.FastROC, bt.indicators.RateOfChange, dict(period=12), 13),
+    (indicators.FastHighest, bt.indicators.Highest, dict(period=30), 30),
+    (indicators.FastLowest, bt.indicators.Lowest, dict(period=30), 30),
+    (indicators.FastStdDev, bt.indicators.StandardDeviation, dict(period=20), 20),
+    (indicators.FastRSI, bt.indicators.RSI, dict(period=14), 15),
+    (indicators.FastBollingerBands, bt.indicators.BollingerBands, dict(period=20), 20),
+    (indicators.FastTrueRange, bt.indicators.TrueRange, dict(), 2),
+]
+
+
+def _run(df, fast, reference, kwargs, runonce):
+    captured = {}
+
+    class _Pair(bt.Strategy):
+        def __init__(self):
+            data = self.data if fast is indicators.FastTrueRange else self.data.close
+            self.fast = fast(data, **kwargs)
+            self.reference = reference(data, **kwargs)
+
+        def stop(self):
+            for name, ind in (("fast", self.fast), ("reference", self.reference)):
+                captured[name] = np.array([np.array(line.array) for line in ind.lines])
+
+    cerebro = bt.Cerebro(stdstats=False, runonce=runonce)
+    cerebro.adddata(bt.feeds.PandasData(dataname=df, openinterest=None))
+    cerebro.addstrategy(_Pair)
+    cerebro.run()
+    return captured["fast"], captured["reference"]
+
+
+@pytest.mark.parametrize("runonce", [True, False])
+@pytest.mark.parametrize("fast, reference, kwargs, minperiod", PAIRS)
+def test_fast_indicator_matches_backtrader(fast, reference, kwargs, minperiod, runonce):
+    df = load_example("tw")
+    # A feed exactly `minperiod` bars long gives `once` an empty range to fill
+    for bars in (minperiod, 300):
+        got, expected = _run(df.iloc[:bars], fast, reference, kwargs, runonce)
+        np.testing.assert_allclose(
+            got[:, minperiod - 1 : bars],
+            expected[:, minperiod - 1 : bars],
+            rtol=1e-9,
+            atol=1e-9,
+            equal_nan=True,
+        )
@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from ai_trader.loader import load_example
+from ai_trader.strategy.classic.momentum import MomentumStrategy
+from ai_trader.strategy.classic.roc import NaiveROCStrategy
+from ai_trader.vector_engine import check_signals, positions_from_signals
+
+
+@pytest.mark.parametrize("strategy", [MomentumStrategy, NaiveROCStrategy])
+@pytest.mark.parametrize("market", ["tw", "us"])
+def test_to_signals_matches_backtrader(strategy, market):
+    df = load_example(market).iloc[:500]
+    assert check_signals(strategy, df) == {"entries": 0, "exits": 0}
+
+
+def test_positions_from_signals():
+    entries = np.array([1, 0, 1, 0, 0, 1], dtype=bool)
+    exits = np.array([0, 0, 0, 1, 1, 1], dtype=bool)
+    np.testing.assert_array_equal(
+        positions_from_signals(entries, exits), [1, 1, 1, 0, 0, 1]
+    )